@@ -0,0 +1,2 @@
+def cpf_check_digits(b: bytes) -> bool: ...
+def cnpj_check_digits(b: bytes) -> bool: ...
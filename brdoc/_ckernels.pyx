@@ -0,0 +1,63 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Cython check digit kernels for CPF and CNPJ.
+
+Both kernels take the ASCII-encoded digit string and mirror brdoc._jit,
+including ord(c) - 48 character values for alphanumeric CNPJs; they return
+False instead of reading out of bounds when the length is wrong.
+"""
+
+
+def cpf_check_digits(bytes b) -> bool:
+    """Check both CPF check digits of an 11-byte ASCII digit buffer."""
+    cdef const unsigned char* p = b
+    cdef int i, value, sum_first = 0, total = 0, first_digit, second_digit
+
+    if len(b) != 11:
+        return False
+
+    # First check digit, summing the digits along the way
+    for i in range(9):
+        value = p[i] - 48
+        sum_first += value * (10 - i)
+        total += value
+    first_digit = (sum_first * 10) % 11
+    if first_digit == 10:
+        first_digit = 0
+
+    if p[9] - 48 != first_digit:
+        return False
+
+    # Second check digit, whose weights are the first ones plus one
+    second_digit = ((sum_first + total + 2 * first_digit) * 10) % 11
+    if second_digit == 10:
+        second_digit = 0
+
+    return p[10] - 48 == second_digit
+
+
+def cnpj_check_digits(bytes b) -> bool:
+    """Check both CNPJ check digits of a 14-byte ASCII buffer (digits or A-Z)."""
+    cdef const unsigned char* p = b
+    cdef int i, value, sum_first = 0, total = 0, first_digit, second_digit
+    cdef int[12] weights = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
+
+    if len(b) != 14:
+        return False
+
+    # First check digit, summing the digits along the way
+    for i in range(12):
+        value = p[i] - 48
+        sum_first += value * weights[i]
+        total += value
+    first_digit = sum_first % 11
+    first_digit = 0 if first_digit < 2 else 11 - first_digit
+
+    if p[12] - 48 != first_digit:
+        return False
+
+    # Second check digit, whose weights are the first ones plus one except
+    # at position 4 (2 instead of 10)
+    second_digit = (sum_first + total + 2 * first_digit - 8 * (p[4] - 48)) % 11
+    second_digit = 0 if second_digit < 2 else 11 - second_digit
+
+    return p[13] - 48 == second_digit
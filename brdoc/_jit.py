@@ -0,0 +1,63 @@
+"""Numba-compiled check digit kernels for CPF and CNPJ.
+
+Importing this module raises ImportError when numba is not installed; see
+brdoc._kernels for how a backend is chosen. Both kernels take the
+ASCII-encoded digit string and assume it already has the right length.
+Characters are valued as ord(c) - 48, so the CNPJ kernel also handles the
+alphanumeric format (A-Z in the first 12 positions).
+"""
+
+from numba import njit
+
+
+@njit(cache=True, boundscheck=False)
+def cpf_check_digits(b: bytes) -> bool:  # pragma: no cover - njit bodies are not traced
+    """Check both CPF check digits of an 11-byte ASCII digit buffer."""
+    # First check digit, summing the digits along the way
+    sum_first = 0
+    total = 0
+    for i in range(9):
+        value = b[i] - 48
+        sum_first += value * (10 - i)
+        total += value
+    first_digit = (sum_first * 10) % 11
+    if first_digit == 10:
+        first_digit = 0
+
+    if b[9] - 48 != first_digit:
+        return False
+
+    # Second check digit, whose weights are the first ones plus one
+    sum_second = sum_first + total + 2 * (b[9] - 48)
+    second_digit = (sum_second * 10) % 11
+    if second_digit == 10:
+        second_digit = 0
+
+    return b[10] - 48 == second_digit
+
+
+@njit(cache=True, boundscheck=False)
+def cnpj_check_digits(b: bytes) -> bool:  # pragma: no cover - njit bodies are not traced
+    """Check both CNPJ check digits of a 14-byte ASCII buffer (digits or A-Z)."""
+    weights = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+    # First check digit, summing the digits along the way
+    sum_first = 0
+    total = 0
+    for i in range(12):
+        value = b[i] - 48
+        sum_first += value * weights[i]
+        total += value
+    first_digit = sum_first % 11
+    first_digit = 0 if first_digit < 2 else 11 - first_digit
+
+    if b[12] - 48 != first_digit:
+        return False
+
+    # Second check digit, whose weights are the first ones plus one except
+    # at position 4 (2 instead of 10)
+    sum_second = sum_first + total + 2 * (b[12] - 48) - 8 * (b[4] - 48)
+    second_digit = sum_second % 11
+    second_digit = 0 if second_digit < 2 else 11 - second_digit
+
+    return b[13] - 48 == second_digit
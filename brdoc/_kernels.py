@@ -0,0 +1,15 @@
+"""Compiled check digit kernels for CPF and CNPJ.
+
+The Cython extension (brdoc._ckernels) is used when it was built at install
+time, otherwise the numba kernels (brdoc._jit). When neither is available
+importing this module raises ImportError, and the cpf/cnpj modules fall back
+to their pure-Python kernels. They import it on their first validation, not
+at import time.
+"""
+
+try:
+    from ._ckernels import cnpj_check_digits, cpf_check_digits
+except ImportError:
+    from ._jit import cnpj_check_digits, cpf_check_digits
+
+__all__ = ["cpf_check_digits", "cnpj_check_digits"]
@@ -0,0 +1,97 @@
+"""Candidate scanner for finding CPF and CNPJ numbers in free text.
+
+Patterns are matched with Hyperscan when it is installed, otherwise with the
+precompiled re pattern. Both report the same leftmost, non-overlapping
+matches as re.finditer, with str offsets.
+"""
+
+import re
+import threading
+from importlib.util import find_spec
+from typing import Any, Dict, List, Tuple
+
+# hyperscan is an optional dependency, imported on the first scan so that
+# ``import brdoc`` does not pay for it
+_HAS_HYPERSCAN = find_spec("hyperscan") is not None
+
+# Compiled Hyperscan databases, keyed by pattern string
+_databases: Dict[str, Any] = {}
+_local = threading.local()
+
+
+def _database(pattern: "re.Pattern[str]") -> Any:
+    """Return the Hyperscan database for pattern, compiling it on first use."""
+    db = _databases.get(pattern.pattern)
+    if db is None:
+        import hyperscan
+
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=[pattern.pattern.encode("ascii")],
+            flags=hyperscan.HS_FLAG_SOM_LEFTMOST,
+        )
+        _databases[pattern.pattern] = db
+    return db
+
+
+def _scratch(pattern: "re.Pattern[str]", db: Any) -> Any:
+    """Return this thread's scratch space for db (scratch cannot be shared)."""
+    scratches = getattr(_local, "scratches", None)
+    if scratches is None:
+        scratches = _local.scratches = {}
+    scratch = scratches.get(pattern.pattern)
+    if scratch is None:
+        import hyperscan
+
+        scratch = scratches[pattern.pattern] = hyperscan.Scratch(db)
+    return scratch
+
+
+def _is_word(c: str) -> bool:
+    """Return True if c is a word character for re's Unicode \\b."""
+    return c.isalnum() or c == "_"
+
+
+def find_spans(pattern: "re.Pattern[str]", text: str) -> List[Tuple[int, int]]:
+    """Return the (start, end) spans of the matches of pattern in text."""
+    if not _HAS_HYPERSCAN:
+        return [m.span() for m in pattern.finditer(text)]
+
+    db = _database(pattern)
+    spans: List[Tuple[int, int]] = []
+    append = spans.append
+
+    def on_match(_id: int, start: int, end: int, _flags: int, _context: Any) -> None:
+        append((start, end))
+
+    data = text.encode("utf-8", "surrogatepass")
+    db.scan(data, match_event_handler=on_match, scratch=_scratch(pattern, db))
+
+    # Hyperscan reports every match in order of end offset
+    spans.sort()
+
+    if len(data) != len(text):
+        # Convert byte offsets to str offsets in one pass over the matches,
+        # which are ASCII. Hyperscan's \b only knows ASCII word characters, so
+        # also drop matches next to a non-ASCII letter or digit, as re would
+        converted: List[Tuple[int, int]] = []
+        byte_pos = char_pos = 0
+        for start, end in spans:
+            char_pos += len(data[byte_pos:start].decode("utf-8", "surrogatepass"))
+            byte_pos = start
+            char_end = char_pos + end - start
+            if (char_pos > 0 and _is_word(text[char_pos - 1])) or (
+                char_end < len(text) and _is_word(text[char_end])
+            ):
+                continue
+            converted.append((char_pos, char_end))
+        spans = converted
+
+    # Keep the leftmost non-overlapping matches, as re.finditer would
+    result: List[Tuple[int, int]] = []
+    last_end = -1
+    for start, end in spans:
+        if start >= last_end:
+            result.append((start, end))
+            last_end = end
+    return result
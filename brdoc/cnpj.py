@@ -1,9 +1,134 @@
 """CNPJ (Cadastro Nacional da Pessoa Jurídica) validation and utilities."""
 
-import re
 import random
+import re
+from functools import lru_cache
+from importlib.util import find_spec
+from operator import mul
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from ._scan import find_spans
 from .exceptions import InvalidCNPJError
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# numpy is an optional dependency, imported by the batch methods on first use
+# so that ``import brdoc`` does not pay for it
+_HAS_NUMPY = find_spec("numpy") is not None
+
+
+class _DigitFilter(Dict[int, Optional[int]]):
+    """str.translate table that keeps ASCII digits and deletes everything else."""
+
+    def __missing__(self, codepoint: int) -> None:
+        # Not stored: caching every codepoint ever seen would let untrusted
+        # input grow this process-global table without bound
+        return None
+
+
+# Prefilled for all of ASCII so ordinary input never reaches __missing__
+_DIGITS_ONLY = _DigitFilter({c: c if 48 <= c <= 57 else None for c in range(128)})
+
+# bytes.translate table mapping CNPJ characters to their values, ord(c) - 48.
+# Besides digits this covers A-Z (17-42) for the alphanumeric CNPJ format, so
+# the check digit math needs no special case for letters; a letter in a check
+# digit position never matches, since check digits are always 0-9
+_CHAR_VAL = bytes(i - 48 if 48 <= i <= 57 or 65 <= i <= 90 else 0 for i in range(256))
+
+# Check digit weights for the first 12 digits. The second check digit weighs
+# the first 13 digits with (6, 5, 4, 3, 2, 9, ..., 2), which is _W1 plus one
+# except at position 4 (2 instead of 10) followed by a 2, so its sum is
+# derived from the first one instead of walking the digits again
+_W1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Check digit for each value of the weighted sum modulo 11
+_DV = bytes(0 if r < 2 else 11 - r for r in range(11))
+
+
+def _py_check_digits(b: bytes) -> bool:
+    """Check both check digits of an ASCII-encoded 14-character CNPJ."""
+    d = b.translate(_CHAR_VAL)
+
+    # First check digit
+    sum_first: int = sum(map(mul, d, _W1))
+    first_digit = _DV[sum_first % 11]
+
+    if d[12] != first_digit:
+        return False
+
+    # Second check digit
+    sum_second = sum_first + sum(d[:13]) + d[12] - 8 * d[4]
+    second_digit = _DV[sum_second % 11]
+
+    return d[13] == second_digit
+
+
+# Candidate CNPJs in free text, formatted or not, with optional separators.
+# [0-9] rather than \d so Unicode digits are not matched, as in _clean
+_CANDIDATE = re.compile(r"\b[0-9]{2}\.?[0-9]{3}\.?[0-9]{3}/?[0-9]{4}-?[0-9]{2}\b")
+
+# Below this many candidates validating one by one beats the NumPy batch setup
+_BATCH_MIN = 64
+
+
+def _load_check_digits(b: bytes) -> bool:
+    """Pick the check digit kernel on first use, then check b with it."""
+    global _check_digits
+    try:
+        from ._kernels import cnpj_check_digits as kernel
+    except ImportError:  # pragma: no cover - compiled kernels are optional
+        kernel = _py_check_digits
+    _check_digits = kernel
+    return kernel(b)
+
+
+# The compiled kernels are loaded by the first validation rather than at
+# import, so that ``import brdoc`` does not load numba and LLVM
+_check_digits: Callable[[bytes], bool] = _load_check_digits
+
+
+@lru_cache(maxsize=65536)
+def _validate_digits(digits: str) -> bool:
+    """Validate a cleaned 14-digit CNPJ string (memoized, see CNPJ.validate)."""
+    # Cannot be all same digits (known invalid CNPJs)
+    if digits.count(digits[0]) == 14:
+        return False
+
+    return _check_digits(digits.encode("ascii"))
+
+
+# Positions of the separators in a formatted CNPJ (XX.XXX.XXX/XXXX-XX)
+_SEPARATORS = {2: ".", 6: ".", 10: "/", 15: "-"}
+
+
+@lru_cache(maxsize=None)
+def _rng() -> "np.random.Generator":
+    """Shared generator for the batch generators, seeded from OS entropy."""
+    import numpy as np
+
+    return np.random.default_rng()
+
+
+def _generate_many_codes(n: int) -> "np.ndarray":
+    """Generate n random valid CNPJs as an (n, 14) array of ASCII digit codes."""
+    import numpy as np
+
+    dv_table = np.frombuffer(_DV, dtype=np.uint8)
+    # Draw full rows in one allocation; the check digit columns are overwritten
+    digits = _rng().integers(0, 10, (n, 14), dtype=np.int32)
+
+    # First check digit
+    sum_first = digits[:, :12] @ np.array(_W1, dtype=np.int32)
+    first_digit = dv_table[sum_first % 11]
+    digits[:, 12] = first_digit
+
+    # Second check digit
+    sum_second = sum_first + digits[:, :12].sum(axis=1) + 2 * first_digit - 8 * digits[:, 4]
+    second_digit = dv_table[sum_second % 11]
+    digits[:, 13] = second_digit
+
+    return (digits + 48).astype(np.uint8)
+
 
 class CNPJ:
     """
@@ -29,6 +154,8 @@ class CNPJ:
         True
     """
 
+    __slots__ = ("_original", "_digits", "_key", "_valid")
+
     def __init__(self, cnpj: str):
         """
         Initialize a CNPJ instance.
@@ -36,13 +163,31 @@ class CNPJ:
         Args:
             cnpj: CNPJ string with or without formatting (dots, slash, and dash)
         """
+        digits = self._clean(cnpj)
         self._original = cnpj
-        self._digits = self._clean(cnpj)
+        self._digits = digits
+        # 14-digit CNPJs compare and hash as ints; anything else keeps its
+        # digit string so distinct malformed inputs stay distinct
+        self._key: Union[int, str] = int(digits) if len(digits) == 14 else digits
+        self._valid: Optional[bool] = None
+
+    @classmethod
+    def _from_digits(cls, digits: str) -> "CNPJ":
+        """Build a CNPJ from a string already known to hold exactly 14 digits."""
+        obj = cls.__new__(cls)
+        obj._original = digits
+        obj._digits = digits
+        obj._key = int(digits)
+        obj._valid = None
+        return obj
 
     @staticmethod
     def _clean(cnpj: str) -> str:
         """Remove all non-digit characters from CNPJ string."""
-        return re.sub(r"\D", "", cnpj)
+        # Already-clean input is the common case and needs no copy
+        if len(cnpj) == 14 and cnpj.isascii() and cnpj.isdigit():
+            return cnpj
+        return cnpj.translate(_DIGITS_ONLY)
 
     @property
     def digits(self) -> str:
@@ -78,52 +223,129 @@ class CNPJ:
         Returns:
             True if valid, False otherwise
         """
-        # Must have 14 digits
-        if len(self._digits) != 14:
-            return False
+        valid = self._valid
+        if valid is None:
+            digits = self._digits
+            # Must have 14 digits; checked here so only 14-digit strings are cached
+            valid = self._valid = len(digits) == 14 and _validate_digits(digits)
+        return valid
 
-        # Cannot be all same digits (known invalid CNPJs)
-        if self._digits == self._digits[0] * 14:
-            return False
+    @classmethod
+    def validate(cls, cnpj: str) -> bool:
+        """
+        Class method to quickly validate a CNPJ string.
 
-        # Validate check digits
-        return self._validate_check_digits()
+        Results are memoized in an LRU cache keyed on the cleaned digits, so
+        formatted and unformatted spellings of the same CNPJ share an entry.
+        Inputs without exactly 14 digits are rejected before reaching the
+        cache. It holds up to 65536 entries and can be reset with
+        ``brdoc.cnpj._validate_digits.cache_clear()``.
 
-    def _validate_check_digits(self) -> bool:
-        """Validate the two check digits using CNPJ algorithm."""
-        # First check digit
-        weights_first = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_first = sum(int(self._digits[i]) * weights_first[i] for i in range(12))
-        first_digit = sum_first % 11
-        first_digit = 0 if first_digit < 2 else 11 - first_digit
+        Args:
+            cnpj: CNPJ string to validate
 
-        if int(self._digits[12]) != first_digit:
-            return False
+        Returns:
+            True if valid, False otherwise
+
+        Example:
+            >>> CNPJ.validate("11.222.333/0001-81")
+            True
+        """
+        digits = cls._clean(cnpj)
+        return len(digits) == 14 and _validate_digits(digits)
+
+    @classmethod
+    def validate_many(cls, cnpjs: Iterable[str]) -> "np.ndarray":
+        """
+        Validate a batch of CNPJ strings in one vectorized pass.
+
+        Each entry is cleaned like the CNPJ constructor does, then both check
+        digits are computed for the whole batch with NumPy matrix products.
+        A one-dimensional ``numpy`` array of ``U14`` strings skips the
+        per-entry cleaning and is validated in place.
+
+        Requires the optional ``numpy`` dependency (``pip install brdoc[numpy]``).
+
+        Args:
+            cnpjs: Iterable of CNPJ strings, or a NumPy string array
+
+        Returns:
+            Boolean NumPy array, True where the corresponding CNPJ is valid
+
+        Raises:
+            ImportError: If numpy is not installed
+
+        Example:
+            >>> CNPJ.validate_many(["11.222.333/0001-81", "11.222.333/0001-82"]).tolist()
+            [True, False]
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("CNPJ.validate_many requires numpy: pip install brdoc[numpy]")
+        import numpy as np
+
+        if isinstance(cnpjs, np.ndarray) and cnpjs.dtype == np.dtype("U14"):
+            # Fixed-width unicode arrays already hold one codepoint per uint32
+            codes = np.ascontiguousarray(cnpjs).reshape(-1).view(np.uint32).reshape(-1, 14)
+            # Shorter entries are NUL padded and anything else non-digit fails here
+            valid = ((codes >= 48) & (codes <= 57)).all(axis=1)
+            digits = codes.astype(np.int32) - 48
+        else:
+            cleaned = [cls._clean(cnpj) for cnpj in cnpjs]
+            valid = np.fromiter((len(d) == 14 for d in cleaned), dtype=bool, count=len(cleaned))
+            # Entries with the wrong length are padded out and masked by valid
+            buf = "".join(d if len(d) == 14 else "0" * 14 for d in cleaned).encode("ascii")
+            buf = buf.translate(_CHAR_VAL)
+            digits = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 14).astype(np.int32)
+
+        dv_table = np.frombuffer(_DV, dtype=np.uint8)
+
+        # Cannot be all same digits (known invalid CNPJs)
+        valid &= (digits != digits[:, :1]).any(axis=1)
+
+        # First check digit
+        sum_first = digits[:, :12] @ np.array(_W1, dtype=np.int32)
+        first_digit = dv_table[sum_first % 11]
+        valid &= digits[:, 12] == first_digit
 
         # Second check digit
-        weights_second = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_second = sum(int(self._digits[i]) * weights_second[i] for i in range(13))
-        second_digit = sum_second % 11
-        second_digit = 0 if second_digit < 2 else 11 - second_digit
+        sum_second = sum_first + digits[:, :13].sum(axis=1) + digits[:, 12] - 8 * digits[:, 4]
+        second_digit = dv_table[sum_second % 11]
+        valid &= digits[:, 13] == second_digit
 
-        return int(self._digits[13]) == second_digit
+        return np.asarray(valid, dtype=bool)
 
     @classmethod
-    def validate(cls, cnpj: str) -> bool:
+    def find_and_validate(cls, text: str) -> List[Tuple[int, str, bool]]:
         """
-        Class method to quickly validate a CNPJ string.
+        Find every CNPJ in a block of text and validate it.
+
+        Candidates are 14-digit numbers, formatted or not, standing on their
+        own (not part of a longer number or word). They are located in one
+        pass with Hyperscan when it is installed (``pip install brdoc[hyperscan]``)
+        and a precompiled regular expression otherwise. Large batches of
+        candidates are checked with validate_many when numpy is available.
 
         Args:
-            cnpj: CNPJ string to validate
+            text: Text to scan, e.g. a document or log
 
         Returns:
-            True if valid, False otherwise
+            List of (start offset, matched text, is valid) tuples in text order
 
         Example:
-            >>> CNPJ.validate("11.222.333/0001-81")
-            True
+            >>> CNPJ.find_and_validate("CNPJ 11.222.333/0001-81, antigo 11222333000182")
+            [(5, '11.222.333/0001-81', True), (32, '11222333000182', False)]
         """
-        return cls(cnpj).is_valid()
+        spans = find_spans(_CANDIDATE, text)
+        matches = [text[start:end] for start, end in spans]
+
+        if _HAS_NUMPY and len(matches) >= _BATCH_MIN:
+            valid: List[bool] = cls.validate_many(matches).tolist()
+        else:
+            # Every candidate cleans to exactly 14 digits, so no length check
+            clean = cls._clean
+            valid = [_validate_digits(clean(match)) for match in matches]
+
+        return [(start, match, ok) for (start, _), match, ok in zip(spans, matches, valid)]
 
     @classmethod
     def generate(cls, formatted: bool = False) -> "CNPJ":
@@ -141,27 +363,78 @@ class CNPJ:
             >>> cnpj.is_valid()
             True
         """
-        # Generate first 12 digits randomly
-        base_digits = [random.randint(0, 9) for _ in range(12)]
+        # Generate first 12 digits randomly with a single RNG call
+        base = f"{random.randrange(10**12):012d}"
+        base_digits = base.encode("ascii").translate(_CHAR_VAL)
 
         # Calculate first check digit
-        weights_first = [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_first = sum(base_digits[i] * weights_first[i] for i in range(12))
-        first_digit = sum_first % 11
-        first_digit = 0 if first_digit < 2 else 11 - first_digit
-        base_digits.append(first_digit)
+        sum_first = sum(map(mul, base_digits, _W1))
+        first_digit = _DV[sum_first % 11]
 
         # Calculate second check digit
-        weights_second = [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]
-        sum_second = sum(base_digits[i] * weights_second[i] for i in range(13))
-        second_digit = sum_second % 11
-        second_digit = 0 if second_digit < 2 else 11 - second_digit
-        base_digits.append(second_digit)
+        sum_second = sum_first + sum(base_digits) + 2 * first_digit - 8 * base_digits[4]
+        second_digit = _DV[sum_second % 11]
+
+        cnpj_str = f"{base}{first_digit}{second_digit}"
+        return cls._from_digits(cnpj_str)
+
+    @classmethod
+    def generate_many(cls, n: int) -> List["CNPJ"]:
+        """
+        Generate n valid random CNPJs in one vectorized pass.
+
+        Requires the optional ``numpy`` dependency (``pip install brdoc[numpy]``).
 
-        cnpj_str = "".join(map(str, base_digits))
-        cnpj_obj = cls(cnpj_str)
+        Args:
+            n: Number of CNPJs to generate
+
+        Returns:
+            A list of n new CNPJ instances
 
-        return cnpj_obj
+        Raises:
+            ImportError: If numpy is not installed
+
+        Example:
+            >>> all(cnpj.is_valid() for cnpj in CNPJ.generate_many(1000))
+            True
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("CNPJ.generate_many requires numpy: pip install brdoc[numpy]")
+
+        buf = _generate_many_codes(n).tobytes().decode("ascii")
+        return [cls._from_digits(buf[i : i + 14]) for i in range(0, len(buf), 14)]
+
+    @classmethod
+    def generate_many_formatted(cls, n: int) -> List[str]:
+        """
+        Generate n valid random CNPJs formatted as XX.XXX.XXX/XXXX-XX.
+
+        Requires the optional ``numpy`` dependency (``pip install brdoc[numpy]``).
+
+        Args:
+            n: Number of CNPJs to generate
+
+        Returns:
+            A list of n formatted CNPJ strings
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "CNPJ.generate_many_formatted requires numpy: pip install brdoc[numpy]"
+            )
+        import numpy as np
+
+        # Scatter the digit columns around fixed separator columns
+        codes = np.empty((n, 18), dtype=np.uint8)
+        digit_columns = [i for i in range(18) if i not in _SEPARATORS]
+        codes[:, digit_columns] = _generate_many_codes(n)
+        for i, sep in _SEPARATORS.items():
+            codes[:, i] = ord(sep)
+
+        buf = codes.tobytes().decode("ascii")
+        return [buf[i : i + 18] for i in range(0, len(buf), 18)]
 
     def __str__(self) -> str:
         """String representation returns formatted CNPJ if valid, otherwise digits."""
@@ -177,9 +450,9 @@ class CNPJ:
     def __eq__(self, other: object) -> bool:
         """Compare CNPJs by their digits."""
         if isinstance(other, CNPJ):
-            return self._digits == other._digits
+            return self._key == other._key
         return False
 
     def __hash__(self) -> int:
         """Make CNPJ hashable for use in sets and dicts."""
-        return hash(self._digits)
+        return hash(self._key)
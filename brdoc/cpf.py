@@ -1,9 +1,131 @@
 """CPF (Cadastro de Pessoas Físicas) validation and utilities."""
 
-import re
 import random
+import re
+from functools import lru_cache
+from importlib.util import find_spec
+from operator import mul
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from ._scan import find_spans
 from .exceptions import InvalidCPFError
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# numpy is an optional dependency, imported by the batch methods on first use
+# so that ``import brdoc`` does not pay for it
+_HAS_NUMPY = find_spec("numpy") is not None
+
+
+class _DigitFilter(Dict[int, Optional[int]]):
+    """str.translate table that keeps ASCII digits and deletes everything else."""
+
+    def __missing__(self, codepoint: int) -> None:
+        # Not stored: caching every codepoint ever seen would let untrusted
+        # input grow this process-global table without bound
+        return None
+
+
+# Prefilled for all of ASCII so ordinary input never reaches __missing__
+_DIGITS_ONLY = _DigitFilter({c: c if 48 <= c <= 57 else None for c in range(128)})
+
+# bytes.translate table mapping ASCII digits to their values
+_DIGIT_VAL = bytes(i - 48 if 48 <= i <= 57 else 0 for i in range(256))
+
+# Check digit weights for the first 9 digits. The second check digit weighs
+# the first 10 digits with (11, 10, ..., 2), i.e. _W1 plus one followed by a 2,
+# so its sum is derived from the first one instead of walking the digits again
+_W1 = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+# Check digit for each value of the weighted sum modulo 11, equivalent to
+# (sum * 10) % 11 with 10 mapped to 0
+_DV = bytes(0 if r < 2 else 11 - r for r in range(11))
+
+
+def _py_check_digits(b: bytes) -> bool:
+    """Check both check digits of an ASCII-encoded 11-digit CPF."""
+    d = b.translate(_DIGIT_VAL)
+
+    # Calculate first check digit
+    sum_first: int = sum(map(mul, d, _W1))
+    first_digit = _DV[sum_first % 11]
+
+    if d[9] != first_digit:
+        return False
+
+    # Calculate second check digit
+    sum_second = sum_first + sum(d[:10]) + d[9]
+    second_digit = _DV[sum_second % 11]
+
+    return d[10] == second_digit
+
+
+# Candidate CPFs in free text, formatted or not, with optional separators.
+# [0-9] rather than \d so Unicode digits are not matched, as in _clean
+_CANDIDATE = re.compile(r"\b[0-9]{3}\.?[0-9]{3}\.?[0-9]{3}-?[0-9]{2}\b")
+
+# Below this many candidates validating one by one beats the NumPy batch setup
+_BATCH_MIN = 64
+
+
+def _load_check_digits(b: bytes) -> bool:
+    """Pick the check digit kernel on first use, then check b with it."""
+    global _check_digits
+    try:
+        from ._kernels import cpf_check_digits as kernel
+    except ImportError:  # pragma: no cover - compiled kernels are optional
+        kernel = _py_check_digits
+    _check_digits = kernel
+    return kernel(b)
+
+
+# The compiled kernels are loaded by the first validation rather than at
+# import, so that ``import brdoc`` does not load numba and LLVM
+_check_digits: Callable[[bytes], bool] = _load_check_digits
+
+
+@lru_cache(maxsize=65536)
+def _validate_digits(digits: str) -> bool:
+    """Validate a cleaned 11-digit CPF string (memoized, see CPF.validate)."""
+    # Cannot be all same digits (known invalid CPFs)
+    if digits.count(digits[0]) == 11:
+        return False
+
+    return _check_digits(digits.encode("ascii"))
+
+
+# Positions of the separators in a formatted CPF (XXX.XXX.XXX-XX)
+_SEPARATORS = {3: ".", 7: ".", 11: "-"}
+
+
+@lru_cache(maxsize=None)
+def _rng() -> "np.random.Generator":
+    """Shared generator for the batch generators, seeded from OS entropy."""
+    import numpy as np
+
+    return np.random.default_rng()
+
+
+def _generate_many_codes(n: int) -> "np.ndarray":
+    """Generate n random valid CPFs as an (n, 11) array of ASCII digit codes."""
+    import numpy as np
+
+    dv_table = np.frombuffer(_DV, dtype=np.uint8)
+    # Draw full rows in one allocation; the check digit columns are overwritten
+    digits = _rng().integers(0, 10, (n, 11), dtype=np.int32)
+
+    # First check digit
+    sum_first = digits[:, :9] @ np.array(_W1, dtype=np.int32)
+    first_digit = dv_table[sum_first % 11]
+    digits[:, 9] = first_digit
+
+    # Second check digit
+    sum_second = sum_first + digits[:, :9].sum(axis=1) + 2 * first_digit
+    second_digit = dv_table[sum_second % 11]
+    digits[:, 10] = second_digit
+
+    return (digits + 48).astype(np.uint8)
+
 
 class CPF:
     """
@@ -29,6 +151,8 @@ class CPF:
         True
     """
 
+    __slots__ = ("_original", "_digits", "_key", "_valid")
+
     def __init__(self, cpf: str):
         """
         Initialize a CPF instance.
@@ -36,13 +160,31 @@ class CPF:
         Args:
             cpf: CPF string with or without formatting (dots and dash)
         """
+        digits = self._clean(cpf)
         self._original = cpf
-        self._digits = self._clean(cpf)
+        self._digits = digits
+        # 11-digit CPFs compare and hash as ints; anything else keeps its
+        # digit string so distinct malformed inputs stay distinct
+        self._key: Union[int, str] = int(digits) if len(digits) == 11 else digits
+        self._valid: Optional[bool] = None
+
+    @classmethod
+    def _from_digits(cls, digits: str) -> "CPF":
+        """Build a CPF from a string already known to hold exactly 11 digits."""
+        obj = cls.__new__(cls)
+        obj._original = digits
+        obj._digits = digits
+        obj._key = int(digits)
+        obj._valid = None
+        return obj
 
     @staticmethod
     def _clean(cpf: str) -> str:
         """Remove all non-digit characters from CPF string."""
-        return re.sub(r"\D", "", cpf)
+        # Already-clean input is the common case and needs no copy
+        if len(cpf) == 11 and cpf.isascii() and cpf.isdigit():
+            return cpf
+        return cpf.translate(_DIGITS_ONLY)
 
     @property
     def digits(self) -> str:
@@ -60,10 +202,11 @@ class CPF:
         Raises:
             InvalidCPFError: If CPF doesn't have exactly 11 digits
         """
-        if len(self._digits) != 11:
-            raise InvalidCPFError(f"CPF must have 11 digits, got {len(self._digits)}")
+        digits = self._digits
+        if len(digits) != 11:
+            raise InvalidCPFError(f"CPF must have 11 digits, got {len(digits)}")
 
-        return f"{self._digits[:3]}.{self._digits[3:6]}.{self._digits[6:9]}-{self._digits[9:]}"
+        return f"{digits[:3]}.{digits[3:6]}.{digits[6:9]}-{digits[9:]}"
 
     def is_valid(self) -> bool:
         """
@@ -77,41 +220,24 @@ class CPF:
         Returns:
             True if valid, False otherwise
         """
-        # Must have 11 digits
-        if len(self._digits) != 11:
-            return False
-
-        # Cannot be all same digits (known invalid CPFs)
-        if self._digits == self._digits[0] * 11:
-            return False
-
-        # Validate check digits
-        return self._validate_check_digits()
-
-    def _validate_check_digits(self) -> bool:
-        """Validate the two check digits using CPF algorithm."""
-        # Calculate first check digit
-        sum_first = sum(int(self._digits[i]) * (10 - i) for i in range(9))
-        first_digit = (sum_first * 10) % 11
-        if first_digit == 10:
-            first_digit = 0
-
-        if int(self._digits[9]) != first_digit:
-            return False
-
-        # Calculate second check digit
-        sum_second = sum(int(self._digits[i]) * (11 - i) for i in range(10))
-        second_digit = (sum_second * 10) % 11
-        if second_digit == 10:
-            second_digit = 0
-
-        return int(self._digits[10]) == second_digit
+        valid = self._valid
+        if valid is None:
+            digits = self._digits
+            # Must have 11 digits; checked here so only 11-digit strings are cached
+            valid = self._valid = len(digits) == 11 and _validate_digits(digits)
+        return valid
 
     @classmethod
     def validate(cls, cpf: str) -> bool:
         """
         Class method to quickly validate a CPF string.
 
+        Results are memoized in an LRU cache keyed on the cleaned digits, so
+        formatted and unformatted spellings of the same CPF share an entry.
+        Inputs without exactly 11 digits are rejected before reaching the
+        cache. It holds up to 65536 entries and can be reset with
+        ``brdoc.cpf._validate_digits.cache_clear()``.
+
         Args:
             cpf: CPF string to validate
 
@@ -122,7 +248,101 @@ class CPF:
             >>> CPF.validate("111.444.777-35")
             True
         """
-        return cls(cpf).is_valid()
+        digits = cls._clean(cpf)
+        return len(digits) == 11 and _validate_digits(digits)
+
+    @classmethod
+    def validate_many(cls, cpfs: Iterable[str]) -> "np.ndarray":
+        """
+        Validate a batch of CPF strings in one vectorized pass.
+
+        Each entry is cleaned like the CPF constructor does, then both check
+        digits are computed for the whole batch with NumPy matrix products.
+        A one-dimensional ``numpy`` array of ``U11`` strings skips the
+        per-entry cleaning and is validated in place.
+
+        Requires the optional ``numpy`` dependency (``pip install brdoc[numpy]``).
+
+        Args:
+            cpfs: Iterable of CPF strings, or a NumPy string array
+
+        Returns:
+            Boolean NumPy array, True where the corresponding CPF is valid
+
+        Raises:
+            ImportError: If numpy is not installed
+
+        Example:
+            >>> CPF.validate_many(["111.444.777-35", "111.444.777-36"]).tolist()
+            [True, False]
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("CPF.validate_many requires numpy: pip install brdoc[numpy]")
+        import numpy as np
+
+        if isinstance(cpfs, np.ndarray) and cpfs.dtype == np.dtype("U11"):
+            # Fixed-width unicode arrays already hold one codepoint per uint32
+            codes = np.ascontiguousarray(cpfs).reshape(-1).view(np.uint32).reshape(-1, 11)
+            # Shorter entries are NUL padded and anything else non-digit fails here
+            valid = ((codes >= 48) & (codes <= 57)).all(axis=1)
+            digits = codes.astype(np.int32) - 48
+        else:
+            cleaned = [cls._clean(cpf) for cpf in cpfs]
+            valid = np.fromiter((len(d) == 11 for d in cleaned), dtype=bool, count=len(cleaned))
+            # Entries with the wrong length are padded out and masked by valid
+            buf = "".join(d if len(d) == 11 else "0" * 11 for d in cleaned).encode("ascii")
+            buf = buf.translate(_DIGIT_VAL)
+            digits = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 11).astype(np.int32)
+
+        dv_table = np.frombuffer(_DV, dtype=np.uint8)
+
+        # Cannot be all same digits (known invalid CPFs)
+        valid &= (digits != digits[:, :1]).any(axis=1)
+
+        # First check digit
+        sum_first = digits[:, :9] @ np.array(_W1, dtype=np.int32)
+        first_digit = dv_table[sum_first % 11]
+        valid &= digits[:, 9] == first_digit
+
+        # Second check digit
+        sum_second = sum_first + digits[:, :10].sum(axis=1) + digits[:, 9]
+        second_digit = dv_table[sum_second % 11]
+        valid &= digits[:, 10] == second_digit
+
+        return np.asarray(valid, dtype=bool)
+
+    @classmethod
+    def find_and_validate(cls, text: str) -> List[Tuple[int, str, bool]]:
+        """
+        Find every CPF in a block of text and validate it.
+
+        Candidates are 11-digit numbers, formatted or not, standing on their
+        own (not part of a longer number or word). They are located in one
+        pass with Hyperscan when it is installed (``pip install brdoc[hyperscan]``)
+        and a precompiled regular expression otherwise. Large batches of
+        candidates are checked with validate_many when numpy is available.
+
+        Args:
+            text: Text to scan, e.g. a document or log
+
+        Returns:
+            List of (start offset, matched text, is valid) tuples in text order
+
+        Example:
+            >>> CPF.find_and_validate("CPF 111.444.777-35, antigo 11144477736")
+            [(4, '111.444.777-35', True), (27, '11144477736', False)]
+        """
+        spans = find_spans(_CANDIDATE, text)
+        matches = [text[start:end] for start, end in spans]
+
+        if _HAS_NUMPY and len(matches) >= _BATCH_MIN:
+            valid: List[bool] = cls.validate_many(matches).tolist()
+        else:
+            # Every candidate cleans to exactly 11 digits, so no length check
+            clean = cls._clean
+            valid = [_validate_digits(clean(match)) for match in matches]
+
+        return [(start, match, ok) for (start, _), match, ok in zip(spans, matches, valid)]
 
     @classmethod
     def generate(cls, formatted: bool = False) -> "CPF":
@@ -140,27 +360,78 @@ class CPF:
             >>> cpf.is_valid()
             True
         """
-        # Generate first 9 digits randomly
-        base_digits = [random.randint(0, 9) for _ in range(9)]
+        # Generate first 9 digits randomly with a single RNG call
+        base = f"{random.randrange(10**9):09d}"
+        base_digits = base.encode("ascii").translate(_DIGIT_VAL)
 
         # Calculate first check digit
-        sum_first = sum(base_digits[i] * (10 - i) for i in range(9))
-        first_digit = (sum_first * 10) % 11
-        if first_digit == 10:
-            first_digit = 0
-        base_digits.append(first_digit)
+        sum_first = sum(map(mul, base_digits, _W1))
+        first_digit = _DV[sum_first % 11]
 
         # Calculate second check digit
-        sum_second = sum(base_digits[i] * (11 - i) for i in range(10))
-        second_digit = (sum_second * 10) % 11
-        if second_digit == 10:
-            second_digit = 0
-        base_digits.append(second_digit)
+        sum_second = sum_first + sum(base_digits) + 2 * first_digit
+        second_digit = _DV[sum_second % 11]
+
+        cpf_str = f"{base}{first_digit}{second_digit}"
+        return cls._from_digits(cpf_str)
+
+    @classmethod
+    def generate_many(cls, n: int) -> List["CPF"]:
+        """
+        Generate n valid random CPFs in one vectorized pass.
+
+        Requires the optional ``numpy`` dependency (``pip install brdoc[numpy]``).
 
-        cpf_str = "".join(map(str, base_digits))
-        cpf_obj = cls(cpf_str)
+        Args:
+            n: Number of CPFs to generate
+
+        Returns:
+            A list of n new CPF instances
 
-        return cpf_obj
+        Raises:
+            ImportError: If numpy is not installed
+
+        Example:
+            >>> all(cpf.is_valid() for cpf in CPF.generate_many(1000))
+            True
+        """
+        if not _HAS_NUMPY:
+            raise ImportError("CPF.generate_many requires numpy: pip install brdoc[numpy]")
+
+        buf = _generate_many_codes(n).tobytes().decode("ascii")
+        return [cls._from_digits(buf[i : i + 11]) for i in range(0, len(buf), 11)]
+
+    @classmethod
+    def generate_many_formatted(cls, n: int) -> List[str]:
+        """
+        Generate n valid random CPFs formatted as XXX.XXX.XXX-XX.
+
+        Requires the optional ``numpy`` dependency (``pip install brdoc[numpy]``).
+
+        Args:
+            n: Number of CPFs to generate
+
+        Returns:
+            A list of n formatted CPF strings
+
+        Raises:
+            ImportError: If numpy is not installed
+        """
+        if not _HAS_NUMPY:
+            raise ImportError(
+                "CPF.generate_many_formatted requires numpy: pip install brdoc[numpy]"
+            )
+        import numpy as np
+
+        # Scatter the digit columns around fixed separator columns
+        codes = np.empty((n, 14), dtype=np.uint8)
+        digit_columns = [i for i in range(14) if i not in _SEPARATORS]
+        codes[:, digit_columns] = _generate_many_codes(n)
+        for i, sep in _SEPARATORS.items():
+            codes[:, i] = ord(sep)
+
+        buf = codes.tobytes().decode("ascii")
+        return [buf[i : i + 14] for i in range(0, len(buf), 14)]
 
     def __str__(self) -> str:
         """String representation returns formatted CPF if valid, otherwise digits."""
@@ -176,9 +447,9 @@ class CPF:
     def __eq__(self, other: object) -> bool:
         """Compare CPFs by their digits."""
         if isinstance(other, CPF):
-            return self._digits == other._digits
+            return self._key == other._key
         return False
 
     def __hash__(self) -> int:
         """Make CPF hashable for use in sets and dicts."""
-        return hash(self._digits)
+        return hash(self._key)
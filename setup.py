@@ -0,0 +1,19 @@
+"""Build script for the optional Cython check digit kernels.
+
+Project metadata lives in pyproject.toml. This file only declares the
+extension module, marked optional so installs without Cython or a C compiler
+still get the pure-Python package.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize("brdoc/_ckernels.pyx")
+    for ext in ext_modules:
+        ext.optional = True
+
+setup(ext_modules=ext_modules)
@@ -1,9 +1,17 @@
 """Tests for CNPJ validation and utilities."""
 
+import re
+
 import pytest
 from brdoc import CNPJ
+from brdoc.cnpj import _DIGITS_ONLY, _py_check_digits, _validate_digits
 from brdoc.exceptions import InvalidCNPJError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestCNPJValidation:
     """Test CNPJ validation logic."""
@@ -39,6 +47,20 @@ class TestCNPJValidation:
         assert CNPJ.validate("11.222.333/0001-81")
         assert not CNPJ.validate("11.222.333/0001-82")
 
+    def test_validate_shares_cache_across_formats(self):
+        """Test that validate() caches results by cleaned digits."""
+        _validate_digits.cache_clear()
+        assert CNPJ.validate("11.222.333/0001-81")
+        assert CNPJ.validate("11222333000181")
+        info = _validate_digits.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+        # Wrong-length input is rejected without adding a cache entry
+        assert not CNPJ.validate("11.222.333/0001-8")
+        assert not CNPJ("1" * 100).is_valid()
+        assert _validate_digits.cache_info().currsize == 1
+
     def test_multiple_valid_cnpjs(self):
         """Test multiple known valid CNPJs."""
         valid_cnpjs = [
@@ -50,6 +72,101 @@ class TestCNPJValidation:
             assert CNPJ(cnpj_str).is_valid()
 
 
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+class TestCNPJValidateMany:
+    """Test vectorized batch validation."""
+
+    def test_matches_scalar_validation(self):
+        """Test that validate_many agrees with validate() entry by entry."""
+        cnpjs = [
+            "11.222.333/0001-81",
+            "11222333000181",
+            "11.222.333/0001-82",
+            "11111111111111",
+            "123",
+            "",
+        ]
+        expected = [CNPJ.validate(c) for c in cnpjs]
+        assert CNPJ.validate_many(cnpjs).tolist() == expected
+
+    def test_generated_cnpjs_are_valid(self):
+        """Test that validate_many accepts generated CNPJs."""
+        cnpjs = [CNPJ.generate().digits for _ in range(50)]
+        assert CNPJ.validate_many(cnpjs).all()
+
+    def test_numpy_string_array(self):
+        """Test the fixed-width NumPy string array fast path."""
+        cnpjs = np.array(["11222333000181", "11111111111111", "1122233300018", "1122233300018x"])
+        assert CNPJ.validate_many(cnpjs).tolist() == [True, False, False, False]
+
+    def test_empty_input(self):
+        """Test that an empty batch returns an empty array."""
+        assert CNPJ.validate_many([]).shape == (0,)
+
+
+class TestCNPJFindAndValidate:
+    """Test finding and validating CNPJs in free text."""
+
+    def test_finds_formatted_and_plain(self):
+        """Test that formatted and plain CNPJs are found with their offsets."""
+        text = "CNPJ 11.222.333/0001-81, antigo 11222333000182."
+        assert CNPJ.find_and_validate(text) == [
+            (text.index("11.222.333/0001-81"), "11.222.333/0001-81", True),
+            (text.index("11222333000182"), "11222333000182", False),
+        ]
+
+    def test_ignores_longer_numbers(self):
+        """Test that digits inside a longer number or word are not matched."""
+        assert CNPJ.find_and_validate("id=112223330001810 x11222333000181") == []
+
+    def test_non_ascii_text_offsets(self):
+        """Test that offsets are str indices when the text is not ASCII."""
+        text = "não é 11.222.333/0001-81"
+        assert CNPJ.find_and_validate(text) == [(text.index("1"), "11.222.333/0001-81", True)]
+
+    def test_regex_fallback_matches_hyperscan(self, monkeypatch):
+        """Test that the re fallback reports the same matches, also in accented text."""
+        cnpjs = [CNPJ.generate().formatted for _ in range(20)]
+        # The last two are glued to a non-ASCII letter, so re's \b rejects them
+        text = " ação ".join(cnpjs + ["11222333000182", "é11222333000181", "11222333000181º"])
+        expected = CNPJ.find_and_validate(text)
+        monkeypatch.setattr("brdoc._scan._HAS_HYPERSCAN", False)
+        assert CNPJ.find_and_validate(text) == expected
+        assert len(expected) == 21
+
+    def test_batched_validation(self):
+        """Test that large batches of candidates agree with validate()."""
+        cnpjs = [CNPJ.generate().digits for _ in range(100)] + ["11222333000182"] * 50
+        results = CNPJ.find_and_validate("\n".join(cnpjs))
+        assert [match for _, match, _ in results] == cnpjs
+        assert [ok for _, _, ok in results] == [CNPJ.validate(c) for c in cnpjs]
+
+
+class TestCNPJKernels:
+    """Test the compiled check digit kernels against the pure-Python one."""
+
+    @pytest.mark.parametrize("module", ["brdoc._ckernels", "brdoc._jit"])
+    def test_kernel_matches_python(self, module):
+        """Test that each compiled kernel agrees on valid and invalid CNPJs."""
+        cnpj_check_digits = pytest.importorskip(module).cnpj_check_digits
+        cnpjs = [CNPJ.generate().digits for _ in range(50)]
+        cnpjs += [str(n).zfill(14) for n in range(0, 10**14, 10**14 // 997)]
+        for cnpj in cnpjs:
+            b = cnpj.encode("ascii")
+            assert cnpj_check_digits(b) == _py_check_digits(b)
+
+    @pytest.mark.parametrize("module", [None, "brdoc._ckernels", "brdoc._jit"])
+    def test_kernel_alphanumeric(self, module):
+        """Test that every kernel accepts the alphanumeric CNPJ format."""
+        if module is None:
+            cnpj_check_digits = _py_check_digits
+        else:
+            cnpj_check_digits = pytest.importorskip(module).cnpj_check_digits
+        assert cnpj_check_digits(b"12ABC34501DE35")
+        assert not cnpj_check_digits(b"12ABC34501DE36")
+        assert not cnpj_check_digits(b"12ABC34501DEA5")
+
+
 class TestCNPJFormatting:
     """Test CNPJ formatting functionality."""
 
@@ -100,11 +217,36 @@ class TestCNPJGeneration:
         # Check that not all CNPJs are the same
         assert len(set(cnpj.digits for cnpj in cnpjs)) > 1
 
+    def test_generated_cnpj_matches_parsed(self):
+        """Test that a generated CNPJ equals one parsed from its digits."""
+        cnpj = CNPJ.generate()
+        parsed = CNPJ(cnpj.digits)
+        assert cnpj == parsed
+        assert repr(cnpj) == repr(parsed)
+
     def test_generated_cnpj_has_correct_length(self):
         """Test that generated CNPJ has 14 digits."""
         cnpj = CNPJ.generate()
         assert len(cnpj.digits) == 14
 
+    @pytest.mark.skipif(np is None, reason="numpy is not installed")
+    def test_generate_many_creates_valid_cnpjs(self):
+        """Test that generate_many creates the requested number of valid CNPJs."""
+        cnpjs = CNPJ.generate_many(200)
+        assert len(cnpjs) == 200
+        assert all(cnpj.is_valid() for cnpj in cnpjs)
+        assert len(set(cnpjs)) > 1
+
+    @pytest.mark.skipif(np is None, reason="numpy is not installed")
+    def test_generate_many_formatted(self):
+        """Test that generate_many_formatted returns formatted valid CNPJs."""
+        cnpjs = CNPJ.generate_many_formatted(200)
+        assert len(cnpjs) == 200
+        for cnpj in cnpjs:
+            assert re.fullmatch(r"\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}", cnpj)
+            assert CNPJ(cnpj).formatted == cnpj
+            assert CNPJ.validate(cnpj)
+
 
 class TestCNPJComparison:
     """Test CNPJ comparison and hashing."""
@@ -121,6 +263,12 @@ class TestCNPJComparison:
         cnpj2 = CNPJ("34.028.316/0001-03")
         assert cnpj1 != cnpj2
 
+    def test_inequality_malformed_cnpjs(self):
+        """Test that malformed CNPJs with different digits are not equal."""
+        assert CNPJ("123") != CNPJ("456")
+        assert CNPJ("123") != CNPJ("0123")
+        assert CNPJ("123") == CNPJ("1.2.3")
+
     def test_hashable(self):
         """Test that CNPJ objects can be used in sets and dicts."""
         cnpj1 = CNPJ("11.222.333/0001-81")
@@ -138,6 +286,22 @@ class TestCNPJComparison:
         data = {cnpj1: "Company 1"}
         assert data[cnpj2] == "Company 1"
 
+    def test_uses_slots(self):
+        """Test that CNPJ instances carry no per-instance __dict__."""
+        cnpj = CNPJ("11222333000181")
+        assert not hasattr(cnpj, "__dict__")
+
+    def test_hash_and_validity_are_stable(self):
+        """Test that hash and memoized validity match fresh computations."""
+        cnpj = CNPJ("11222333000181")
+        assert hash(cnpj) == hash(cnpj) == hash(CNPJ("11222333000181"))
+        assert cnpj._valid is None
+        assert cnpj.is_valid()
+        assert cnpj._valid is True
+        hits = _validate_digits.cache_info().hits
+        assert cnpj.is_valid()
+        assert _validate_digits.cache_info().hits == hits
+
 
 class TestCNPJEdgeCases:
     """Test edge cases and special scenarios."""
@@ -163,3 +327,21 @@ class TestCNPJEdgeCases:
         cnpj = CNPJ("11ABC222DEF333GHI0001IJK81")
         assert cnpj.digits == "11222333000181"
         assert cnpj.is_valid()
+
+    def test_non_ascii_digits_are_stripped(self):
+        """Test that only ASCII digits are kept when cleaning."""
+        cnpj = CNPJ("11.222.333/0001-81١٢")
+        assert cnpj.digits == "11222333000181"
+        assert cnpj.is_valid()
+
+    def test_cleaning_table_does_not_grow(self):
+        """Test that cleaning non-ASCII input leaves the translate table unchanged."""
+        size = len(_DIGITS_ONLY)
+        CNPJ("11.222.333/0001-81" + "".join(map(chr, range(0x100, 0x2100))))
+        assert len(_DIGITS_ONLY) == size
+
+    def test_unicode_digit_lookalikes_are_stripped(self):
+        """Test that a 14-char input with non-ASCII digits is still cleaned."""
+        cnpj = CNPJ("1122233300018²")
+        assert cnpj.digits == "1122233300018"
+        assert not cnpj.is_valid()
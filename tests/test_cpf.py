@@ -1,9 +1,19 @@
 """Tests for CPF validation and utilities."""
 
+import re
+import subprocess
+import sys
+
 import pytest
 from brdoc import CPF
+from brdoc.cpf import _DIGITS_ONLY, _py_check_digits, _validate_digits
 from brdoc.exceptions import InvalidCPFError
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class TestCPFValidation:
     """Test CPF validation logic."""
@@ -39,6 +49,20 @@ class TestCPFValidation:
         assert CPF.validate("111.444.777-35")
         assert not CPF.validate("111.444.777-36")
 
+    def test_validate_shares_cache_across_formats(self):
+        """Test that validate() caches results by cleaned digits."""
+        _validate_digits.cache_clear()
+        assert CPF.validate("111.444.777-35")
+        assert CPF.validate("11144477735")
+        info = _validate_digits.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+        # Wrong-length input is rejected without adding a cache entry
+        assert not CPF.validate("111.444.777-3")
+        assert not CPF("1" * 100).is_valid()
+        assert _validate_digits.cache_info().currsize == 1
+
     def test_multiple_valid_cpfs(self):
         """Test multiple known valid CPFs."""
         valid_cpfs = [
@@ -50,6 +74,98 @@ class TestCPFValidation:
             assert CPF(cpf_str).is_valid()
 
 
+@pytest.mark.skipif(np is None, reason="numpy is not installed")
+class TestCPFValidateMany:
+    """Test vectorized batch validation."""
+
+    def test_matches_scalar_validation(self):
+        """Test that validate_many agrees with validate() entry by entry."""
+        cpfs = ["111.444.777-35", "11144477735", "111.444.777-36", "11111111111", "123", ""]
+        expected = [CPF.validate(c) for c in cpfs]
+        assert CPF.validate_many(cpfs).tolist() == expected
+
+    def test_generated_cpfs_are_valid(self):
+        """Test that validate_many accepts generated CPFs."""
+        cpfs = [CPF.generate().digits for _ in range(50)]
+        assert CPF.validate_many(cpfs).all()
+
+    def test_numpy_string_array(self):
+        """Test the fixed-width NumPy string array fast path."""
+        cpfs = np.array(["11144477735", "11111111111", "1114447773", "1114447773x"])
+        assert CPF.validate_many(cpfs).tolist() == [True, False, False, False]
+
+    def test_empty_input(self):
+        """Test that an empty batch returns an empty array."""
+        assert CPF.validate_many([]).shape == (0,)
+
+    def test_import_does_not_load_numpy(self):
+        """Test that numpy and hyperscan are only imported once a method needs them."""
+        code = "import sys, brdoc; print('numpy' in sys.modules, 'hyperscan' in sys.modules)"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert out.stdout.split() == ["False", "False"]
+
+
+class TestCPFFindAndValidate:
+    """Test finding and validating CPFs in free text."""
+
+    def test_finds_formatted_and_plain(self):
+        """Test that formatted and plain CPFs are found with their offsets."""
+        text = "CPF 111.444.777-35, antigo 11144477736."
+        assert CPF.find_and_validate(text) == [
+            (text.index("111.444.777-35"), "111.444.777-35", True),
+            (text.index("11144477736"), "11144477736", False),
+        ]
+
+    def test_ignores_longer_numbers(self):
+        """Test that digits inside a longer number or word are not matched."""
+        assert CPF.find_and_validate("id=111444777350 x11144477735") == []
+
+    def test_non_ascii_text_offsets(self):
+        """Test that offsets are str indices when the text is not ASCII."""
+        text = "não é 111.444.777-35"
+        assert CPF.find_and_validate(text) == [(text.index("1"), "111.444.777-35", True)]
+
+    def test_regex_fallback_matches_hyperscan(self, monkeypatch):
+        """Test that the re fallback reports the same matches, also in accented text."""
+        cpfs = [CPF.generate().formatted for _ in range(20)]
+        # The last two are glued to a non-ASCII letter, so re's \b rejects them
+        text = " ação ".join(cpfs + ["11144477736", "é11144477735", "11144477735º"])
+        expected = CPF.find_and_validate(text)
+        monkeypatch.setattr("brdoc._scan._HAS_HYPERSCAN", False)
+        assert CPF.find_and_validate(text) == expected
+        assert len(expected) == 21
+
+    def test_batched_validation(self):
+        """Test that large batches of candidates agree with validate()."""
+        cpfs = [CPF.generate().digits for _ in range(100)] + ["11144477736"] * 50
+        results = CPF.find_and_validate("\n".join(cpfs))
+        assert [match for _, match, _ in results] == cpfs
+        assert [ok for _, _, ok in results] == [CPF.validate(c) for c in cpfs]
+
+
+class TestCPFKernels:
+    """Test the compiled check digit kernels against the pure-Python one."""
+
+    def test_kernels_load_on_first_validation(self):
+        """Test that import brdoc defers loading the compiled kernels."""
+        code = (
+            "import sys, brdoc; print('brdoc._kernels' in sys.modules);"
+            " brdoc.CPF.validate('111.444.777-35'); print(brdoc.CPF('11144477735').is_valid())"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+        assert out.stdout.split() == ["False", "True"]
+
+    @pytest.mark.parametrize("module", ["brdoc._ckernels", "brdoc._jit"])
+    def test_kernel_matches_python(self, module):
+        """Test that each compiled kernel agrees on valid and invalid CPFs."""
+        cpf_check_digits = pytest.importorskip(module).cpf_check_digits
+        cpfs = [CPF.generate().digits for _ in range(50)]
+        cpfs += [str(n).zfill(11) for n in range(0, 10**11, 10**11 // 997)]
+        for cpf in cpfs:
+            b = cpf.encode("ascii")
+            assert cpf_check_digits(b) == _py_check_digits(b)
+
+
 class TestCPFFormatting:
     """Test CPF formatting functionality."""
 
@@ -100,11 +216,36 @@ class TestCPFGeneration:
         # Check that not all CPFs are the same
         assert len(set(cpf.digits for cpf in cpfs)) > 1
 
+    def test_generated_cpf_matches_parsed(self):
+        """Test that a generated CPF equals one parsed from its digits."""
+        cpf = CPF.generate()
+        parsed = CPF(cpf.digits)
+        assert cpf == parsed
+        assert repr(cpf) == repr(parsed)
+
     def test_generated_cpf_has_correct_length(self):
         """Test that generated CPF has 11 digits."""
         cpf = CPF.generate()
         assert len(cpf.digits) == 11
 
+    @pytest.mark.skipif(np is None, reason="numpy is not installed")
+    def test_generate_many_creates_valid_cpfs(self):
+        """Test that generate_many creates the requested number of valid CPFs."""
+        cpfs = CPF.generate_many(200)
+        assert len(cpfs) == 200
+        assert all(cpf.is_valid() for cpf in cpfs)
+        assert len(set(cpfs)) > 1
+
+    @pytest.mark.skipif(np is None, reason="numpy is not installed")
+    def test_generate_many_formatted(self):
+        """Test that generate_many_formatted returns formatted valid CPFs."""
+        cpfs = CPF.generate_many_formatted(200)
+        assert len(cpfs) == 200
+        for cpf in cpfs:
+            assert re.fullmatch(r"\d{3}\.\d{3}\.\d{3}-\d{2}", cpf)
+            assert CPF(cpf).formatted == cpf
+            assert CPF.validate(cpf)
+
 
 class TestCPFComparison:
     """Test CPF comparison and hashing."""
@@ -121,6 +262,12 @@ class TestCPFComparison:
         cpf2 = CPF("231.002.999-00")
         assert cpf1 != cpf2
 
+    def test_inequality_malformed_cpfs(self):
+        """Test that malformed CPFs with different digits are not equal."""
+        assert CPF("123") != CPF("456")
+        assert CPF("123") != CPF("0123")
+        assert CPF("123") == CPF("1.2.3")
+
     def test_hashable(self):
         """Test that CPF objects can be used in sets and dicts."""
         cpf1 = CPF("111.444.777-35")
@@ -138,6 +285,22 @@ class TestCPFComparison:
         data = {cpf1: "Person 1"}
         assert data[cpf2] == "Person 1"
 
+    def test_uses_slots(self):
+        """Test that CPF instances carry no per-instance __dict__."""
+        cpf = CPF("11144477735")
+        assert not hasattr(cpf, "__dict__")
+
+    def test_hash_and_validity_are_stable(self):
+        """Test that hash and memoized validity match fresh computations."""
+        cpf = CPF("11144477735")
+        assert hash(cpf) == hash(cpf) == hash(CPF("11144477735"))
+        assert cpf._valid is None
+        assert cpf.is_valid()
+        assert cpf._valid is True
+        hits = _validate_digits.cache_info().hits
+        assert cpf.is_valid()
+        assert _validate_digits.cache_info().hits == hits
+
 
 class TestCPFEdgeCases:
     """Test edge cases and special scenarios."""
@@ -163,3 +326,21 @@ class TestCPFEdgeCases:
         cpf = CPF("111ABC444DEF777GHI35")
         assert cpf.digits == "11144477735"
         assert cpf.is_valid()
+
+    def test_non_ascii_digits_are_stripped(self):
+        """Test that only ASCII digits are kept when cleaning."""
+        cpf = CPF("111.444.777-35١٢")
+        assert cpf.digits == "11144477735"
+        assert cpf.is_valid()
+
+    def test_cleaning_table_does_not_grow(self):
+        """Test that cleaning non-ASCII input leaves the translate table unchanged."""
+        size = len(_DIGITS_ONLY)
+        CPF("111.444.777-35" + "".join(map(chr, range(0x100, 0x2100))))
+        assert len(_DIGITS_ONLY) == size
+
+    def test_unicode_digit_lookalikes_are_stripped(self):
+        """Test that an 11-char input with non-ASCII digits is still cleaned."""
+        cpf = CPF("1114447773²")
+        assert cpf.digits == "1114447773"
+        assert not cpf.is_valid()